@@ -1,9 +1,30 @@
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson instead of the stdlib json module.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # Like the default provider, convert non-str keys and indent when asked to (e.g. in debug mode)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app():
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     CORS(app)
 
     from .routes import app as routes_blueprint
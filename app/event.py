@@ -1,88 +1,131 @@
 import re
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional, List
 import datetime as dt
-import dateutil.rrule
 
-
-@dataclass
+# <br>, <hr>, &#10; (LF) and &#13; (CR) imply new lines
+_HTML_NEWLINE_RE = re.compile(r'(?i)<br\s*/?>|<hr\s*/?>|&#10;|&#13;')
+
+
+def _strip_tags(input_string: str) -> str:
+    """
+    Removes all HTML tags from a string in a single linear scan.
+    Unlike a `<[^>]+>` regex, this cannot backtrack on unmatched `<`.
+    Args:
+        input_string (str): The string to remove the tags from.
+    Returns:
+        str: The string without HTML tags.
+    """
+    parts = []
+    i, n = 0, len(input_string)
+    while i < n:
+        j = input_string.find('<', i)
+        if j < 0:
+            parts.append(input_string[i:])
+            break
+        parts.append(input_string[i:j])
+
+        k = input_string.find('>', j + 1)
+        if k < 0:
+            # Unmatched '<' is not a tag, keep the remainder as is
+            parts.append(input_string[j:])
+            break
+        if k == j + 1:
+            # '<>' is not a tag either
+            parts.append('<>')
+        i = k + 1
+
+    return ''.join(parts)
+
+
+# Human-readable text of the supported RRULE frequencies
+_FREQ_MAP = {
+    "DAILY": "DAILY",
+    "WEEKLY": "WEEKLY",
+    "MONTHLY": "MONTHLY",
+    "YEARLY": "YEARLY"
+}
+
+# Special cased (frequency, interval) pairs
+_FREQ_INTERVAL_MAP = {
+    ("WEEKLY", 2): "BI-WEEKLY",
+    ("DAILY", 2): "BI-DAILY"
+}
+
+
+@dataclass(slots=True)
 class EventRecurrence:
     text: str = field(init=False)
     rrule: str
 
 
     def __post_init__(self):
-        rrule_object = dateutil.rrule.rrulestr(self.rrule)
-        self.text = self._rrule_to_text(rrule_object)
-
-    def _rrule_to_text(self, rrule: dateutil.rrule.rrule) -> str:
-        """
-        Converts a dateutil rrule object to a human-readable text representation.
-        Args:
-            rrule (dateutil.rrule.rrule): The rrule object to be converted.
-        Returns:
-            str: The human-readable text representation of the rrule.
-        """
-        freq_map = {
-            dateutil.rrule.DAILY: "DAILY",
-            dateutil.rrule.WEEKLY: "WEEKLY",
-            dateutil.rrule.MONTHLY: "MONTHLY",
-            dateutil.rrule.YEARLY: "YEARLY"
-        }
-        
-        interval = rrule._interval
-        freq = rrule._freq
-        
-        if freq in freq_map:
+        # Only FREQ and INTERVAL are needed for the text, so read them from the
+        # RRULE tokens instead of building a full dateutil rrule
+        parts = dict(
+            part.split('=', 1)
+            for part in self.rrule.removeprefix('RRULE:').split(';')
+            if '=' in part
+        )
+        freq = parts.get('FREQ', '').upper()
+        interval = int(parts.get('INTERVAL', '1'))
+
+        if freq in _FREQ_MAP:
             if interval == 1:
-                return freq_map[freq]
-            elif interval == 2 and freq == dateutil.rrule.WEEKLY:
-                return "BI-WEEKLY"
-            elif interval == 2 and freq == dateutil.rrule.DAILY:
-                return "BI-DAILY"
+                self.text = _FREQ_MAP[freq]
             else:
-                return f"EVERY {interval} {freq_map[freq]}"
+                self.text = _FREQ_INTERVAL_MAP.get((freq, interval), f"EVERY {interval} {_FREQ_MAP[freq]}")
         else:
-            return "REPEATING"
+            self.text = "REPEATING"
 
+    def to_dict(self) -> dict:
+        return {"text": self.text, "rrule": self.rrule}
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     title_raw: str
     description: str
-    start_datetime: dt.datetime = field(metadata={"exclude": True})
-    end_datetime: dt.datetime  = field(metadata={"exclude": True})
+    start_datetime: dt.datetime
+    end_datetime: dt.datetime
     recurrence: Optional[EventRecurrence] = None
 
     title: str = field(init=False)
-    start: str = field(init=False)
-    end: str = field(init=False)
     is_all_day: bool = field(init=False)
 
 
     def __post_init__(self):
         self.title_raw = self.title_raw.strip()
-        self.title = ' '.join(self.title_raw.split()[:3]).upper()
-
-        self.start = self.start_datetime.isoformat()
-        self.end = self.end_datetime.isoformat()
+        self.title = ' '.join(self.title_raw.split(maxsplit=3)[:3]).upper()
 
         self.is_all_day = self.start_datetime.time() == dt.time.min and self.end_datetime.time() == dt.time.min
 
         self.description = self._clean_html(self.description) if self.description else ''
 
+    def to_dict(self) -> dict:
+        """
+        Converts the event to a dictionary for serialization.
+        `start_datetime` and `end_datetime` are serialized as ISO strings under `start` and `end`.
+        Returns:
+            dict: The serializable representation of the event.
+        """
+        return {
+            "title_raw": self.title_raw,
+            "description": self.description,
+            "recurrence": self.recurrence.to_dict() if self.recurrence else None,
+            "title": self.title,
+            "start": self.start_datetime.isoformat(),
+            "end": self.end_datetime.isoformat(),
+            "is_all_day": self.is_all_day
+        }
+
     def _clean_html(self, input_string):
-        # Replace various tags that imply new lines with \n
-        input_string = re.sub(r'<br\s*/?>', '\n', input_string, flags=re.IGNORECASE)    # <br>
-        input_string = re.sub(r'<hr\s*/?>', '\n', input_string, flags=re.IGNORECASE)    # <hr>
-        
-        # Replace newline HTML entities with \n
-        input_string = re.sub(r'&#10;', '\n', input_string)  # ASCII Line Feed (LF)
-        input_string = re.sub(r'&#13;', '\n', input_string)  # ASCII Carriage Return (CR)
-        
+        # Replace various tags and entities that imply new lines with \n
+        input_string = _HTML_NEWLINE_RE.sub('\n', input_string)
+
         # Remove all other HTML tags
-        cleaned_string = re.sub(r'<[^>]+>', '', input_string)
-        
+        cleaned_string = _strip_tags(input_string)
+
         # Strip leading/trailing whitespace
         return cleaned_string.strip()
 
@@ -91,13 +134,5 @@ class Event:
 class EventList:
     events: List[Event]
 
-    def _asdict_exclude(self, obj):
-        result = {}
-        for key, value in asdict(obj).items():
-            field_meta = obj.__dataclass_fields__[key].metadata
-            if not field_meta.get('exclude', False):
-                result[key] = value
-        return result
-
     def serialize(self):
-        return [self._asdict_exclude(event) for event in self.events]
+        return [event.to_dict() for event in self.events]
@@ -1,24 +1,49 @@
 import datetime as dt
+import itertools
+import multiprocessing
 import os
-from datetime import date, datetime
-from typing import Optional, Union
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import dateutil.rrule
 import requests
-from dateutil import tz
 from dotenv import load_dotenv
-from icalendar import Calendar
+from requests.adapters import HTTPAdapter
 
 from app.event import Event, EventRecurrence, EventList
+from app.ics_parser import CalendarEvent, parse_vevents
 
 load_dotenv()
 
 ICS_URL = os.getenv('ICS_URL')
 
+# Shared session so connections (and TLS handshakes) are reused between requests
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+_UTC = timezone.utc
+
+# Last ICS response per URL as (validator headers, content) for conditional requests
+_ICS_CACHE: Dict[str, Tuple[Dict[str, str], bytes]] = {}
+
+# Calendars with at least this many recurring events expand their RRULEs in a process pool,
+# given more than one CPU. The threshold is an unmeasured estimate of where the pool pays off.
+_PARALLEL_RRULE_THRESHOLD = 256
+_RRULE_WORKERS = os.cpu_count() or 1
+_RRULE_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_RRULE_EXECUTOR_LOCK = threading.Lock()
+
 
 def _fetch_ics_from_url(url: str) -> bytes:
     """
     Fetches the content of an ICS file from the given URL.
+    The last response is revalidated with ETag/Last-Modified, so an unchanged ICS file is not downloaded again.
     Args:
         url (str): The URL of the ICS file.
     Returns:
@@ -26,8 +51,25 @@ def _fetch_ics_from_url(url: str) -> bytes:
     Raises:
         requests.HTTPError: If the HTTP request to the URL fails or returns a non-successful status code.
     """
-    response = requests.get(url)
+    validators, content = _ICS_CACHE.get(url, ({}, b''))
+
+    response = _SESSION.get(url, headers=validators, timeout=10)
+    if response.status_code == 304 and content:
+        return content
+
     response.raise_for_status()  # Ensure we notice bad responses
+
+    validators = {}
+    if 'ETag' in response.headers:
+        validators['If-None-Match'] = response.headers['ETag']
+    if 'Last-Modified' in response.headers:
+        validators['If-Modified-Since'] = response.headers['Last-Modified']
+
+    if validators:
+        _ICS_CACHE[url] = (validators, response.content)
+    else:
+        _ICS_CACHE.pop(url, None)
+
     return response.content
 
 def _ensure_datetime(timestamp: Union[date, datetime]) -> datetime:
@@ -38,16 +80,97 @@ def _ensure_datetime(timestamp: Union[date, datetime]) -> datetime:
     Returns:
         datetime: The datetime object in UTC timezone.
     """
-    if isinstance(timestamp, date) and not isinstance(timestamp, datetime):
-        timestamp = datetime.combine(timestamp, dt.time.min, tzinfo=tz.UTC)
-    
-    # convert to UTC timezone
-    if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=tz.UTC)
-    else:
-        timestamp = timestamp.astimezone(tz.UTC)
+    if type(timestamp) is date:
+        return datetime(timestamp.year, timestamp.month, timestamp.day, tzinfo=_UTC)
+
+    # convert to UTC timezone, unless it already is
+    tzinfo = timestamp.tzinfo
+    if tzinfo is _UTC:
+        return timestamp
+    if tzinfo is None:
+        return timestamp.replace(tzinfo=_UTC)
+    return timestamp.astimezone(_UTC)
+
+def _next_occurance(rrule_raw: str, dtstart: datetime, week_start: datetime) -> Optional[datetime]:
+    """
+    Finds the next occurance of a recurring event after the given week start.
+    Args:
+        rrule_raw (str): The RRULE of the event.
+        dtstart (datetime): The start of the first occurance of the event.
+        week_start (datetime): The start of the week.
+    Returns:
+        Optional[datetime]: The start of the next occurance or None if the event does not occur anymore.
+    """
+    rrule = dateutil.rrule.rrulestr(rrule_raw, dtstart=dtstart)
+    return rrule.after(week_start)
+
+def _next_occurances(rrules: List[str], dtstarts: List[datetime], week_start: datetime) -> List[Optional[datetime]]:
+    """
+    Finds the next occurances of recurring events after the given week start, preserving their order.
+    The expansion is pure Python, so large amounts of recurring events are spread over a process pool when there is more than one CPU.
+    Args:
+        rrules (List[str]): The RRULEs of the events.
+        dtstarts (List[datetime]): The starts of the first occurances of the events.
+        week_start (datetime): The start of the week.
+    Returns:
+        List[Optional[datetime]]: The starts of the next occurances.
+    """
+    global _RRULE_EXECUTOR
 
-    return timestamp
+    if _RRULE_WORKERS == 1 or len(rrules) < _PARALLEL_RRULE_THRESHOLD:
+        return list(map(_next_occurance, rrules, dtstarts, itertools.repeat(week_start)))
+
+    with _RRULE_EXECUTOR_LOCK:
+        if _RRULE_EXECUTOR is None:
+            # Forking the multi-threaded server process can deadlock, so workers come from a forkserver
+            _RRULE_EXECUTOR = ProcessPoolExecutor(
+                max_workers=_RRULE_WORKERS, mp_context=multiprocessing.get_context('forkserver')
+            )
+        executor = _RRULE_EXECUTOR
+
+    chunksize = max(1, len(rrules) // (_RRULE_WORKERS * 4))
+    try:
+        return list(executor.map(_next_occurance, rrules, dtstarts, itertools.repeat(week_start), chunksize=chunksize))
+    except BrokenProcessPool:
+        # A worker died, drop the pool so the next call creates a new one and expand serially for now
+        with _RRULE_EXECUTOR_LOCK:
+            if _RRULE_EXECUTOR is executor:
+                _RRULE_EXECUTOR = None
+        executor.shutdown(wait=False)
+
+        return list(map(_next_occurance, rrules, dtstarts, itertools.repeat(week_start)))
+
+@lru_cache(maxsize=4)
+def _parse_vevents(ics_content: bytes) -> Tuple[CalendarEvent, ...]:
+    """
+    Parses the VEVENTs of an iCalendar (ICS) content and converts their start and end to UTC.
+    The result is cached per content, so an unchanged ICS file is only parsed and converted once.
+    Args:
+        ics_content (bytes): The iCalendar content as bytes.
+    Returns:
+        Tuple[CalendarEvent, ...]: The events of the calendar.
+    """
+    vevents = parse_vevents(ics_content)
+    for vevent in vevents:
+        vevent.dtstart = _ensure_datetime(vevent.dtstart)
+        vevent.dtend = _ensure_datetime(vevent.dtend)
+
+    return vevents
+
+def get_week_start(current_time: Optional[datetime]=None) -> datetime:
+    """
+    Gets the start of the week, meaning monday of the current week at midnight in UTC.
+    Events are filtered by the week start only, so it identifies the result of fetch_events for a given ICS file.
+    Args:
+        current_time (Optional[datetime]): The current time. If not provided, the current UTC time will be used.
+    Returns:
+        datetime: The start of the week.
+    """
+    # Ensure current_time is in UTC timezone if provided else use current time
+    current_time = _ensure_datetime(current_time) if current_time is not None else datetime.now(tz=_UTC)
+
+    week_start = current_time - dt.timedelta(days=current_time.weekday())
+    return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
 
 def _get_events_from_ics(ics_content: bytes, current_time: datetime) -> EventList:
     """
@@ -60,61 +183,56 @@ def _get_events_from_ics(ics_content: bytes, current_time: datetime) -> EventLis
     Raises:
         Exception: If an error occurs while parsing the iCalendar content.
     """
-    gcal = Calendar.from_ical(ics_content)
+    # Events as (start, index in the file, event), the index keeps the file order for equal starts
     events = []
-
-    # Ensure current_time is in UTC timezone if provided else use current time
-    current_time = _ensure_datetime(current_time)
-
-    # Get the start of the week, meaning monday of the current week at midnight
-    week_start = current_time - dt.timedelta(days=current_time.weekday())
-    week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    for component in gcal.walk():
-        if component.name == "VEVENT":
-            dtstart = _ensure_datetime(component.get('dtstart').dt)
-            dtend = _ensure_datetime(component.get('dtend').dt)
-
-            title_raw = component.get('summary')
-            description = component.get('description')
-
-            event = Event(
-                title_raw=title_raw, description=description,
-                start_datetime=dtstart, end_datetime=dtend
-            )
-
-            if 'RRULE' in component:
-                rrule_raw = component.get('RRULE').to_ical().decode()
-                rrule = dateutil.rrule.rrulestr(rrule_raw, dtstart=dtstart)
-                next_event_occurance = rrule.after(week_start)
-
-                if next_event_occurance:
-                    event.start = next_event_occurance.isoformat()
-                    event.end = (next_event_occurance + (dtend - dtstart)).isoformat()
-
-                    event.recurrence = EventRecurrence(rrule=rrule_raw)
-
-                    events.append(event)
-            elif dtstart >= week_start:
-                events.append(event)
-
-    # Sort events by start date
-    events = sorted(events, key=lambda x: x.start)
-
-    return EventList(events)
-
-def fetch_events(current_time: Optional[datetime]=None) -> EventList:
+    # Recurring events as (index, vevent, duration), built once their next occurance is known
+    recurring_events = []
+    rrules = []
+    dtstarts = []
+
+    week_start = get_week_start(current_time)
+
+    for index, vevent in enumerate(_parse_vevents(ics_content)):
+        if vevent.rrule:
+            duration = vevent.dtend - vevent.dtstart
+            recurring_events.append((index, vevent, duration))
+            rrules.append(vevent.rrule)
+            dtstarts.append(vevent.dtstart)
+        elif vevent.dtstart >= week_start:
+            events.append((vevent.dtstart, index, Event(
+                title_raw=vevent.summary, description=vevent.description,
+                start_datetime=vevent.dtstart, end_datetime=vevent.dtend
+            )))
+
+    next_event_occurances = _next_occurances(rrules, dtstarts, week_start)
+
+    for (index, vevent, duration), rrule_raw, next_event_occurance in zip(recurring_events, rrules, next_event_occurances):
+        if next_event_occurance:
+            events.append((next_event_occurance, index, Event(
+                title_raw=vevent.summary, description=vevent.description,
+                start_datetime=next_event_occurance,
+                end_datetime=next_event_occurance + duration,
+                recurrence=EventRecurrence(rrule=rrule_raw)
+            )))
+
+    # Sort events by start date, events starting at the same time stay in file order
+    events = sorted(events, key=lambda x: (x[0], x[1]))
+
+    return EventList([event for _, _, event in events])
+
+def fetch_events(current_time: Optional[datetime]=None, ics_url: Optional[str]=ICS_URL) -> EventList:
     """
     Fetches events from the ICS URL and returns a list of dictionaries representing the events.
     Args:
         current_time (Optional[datetime]): The current time to use for filtering events. If not provided, the current UTC time will be used.
+        ics_url (Optional[str]): The URL of the ICS file. Defaults to the ICS_URL read from the environment at import time.
     Returns:
         EventList: A list of Event objects.
     """
     if current_time is None:
-        current_time = datetime.now(tz=tz.UTC)
+        current_time = datetime.now(tz=_UTC)
 
-    ics_content = _fetch_ics_from_url(ICS_URL)
+    ics_content = _fetch_ics_from_url(ics_url)
     events: EventList = _get_events_from_ics(ics_content, current_time)
 
     return events
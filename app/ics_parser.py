@@ -0,0 +1,172 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import pytz
+from icalendar import Calendar
+from icalendar.parser import NEWLINE, escape_string, unescape_char, unescape_string
+from icalendar.prop import vRecur
+
+# Content lines starting with a space or tab continue the previous line (RFC 5545, 3.1)
+_FOLD_RE = re.compile(r'(\r?\n)+[ \t]')
+
+# VEVENT properties needed to build events
+_PROPERTIES = frozenset(('DTSTART', 'DTEND', 'SUMMARY', 'DESCRIPTION', 'RRULE'))
+
+
+@dataclass(slots=True)
+class CalendarEvent:
+    dtstart: Union[date, datetime]
+    dtend: Union[date, datetime]
+    summary: Optional[str]
+    description: Optional[str]
+    rrule: Optional[str]
+
+
+@lru_cache(maxsize=256)
+def _canonical_rrule(rrule: str) -> str:
+    """
+    Converts an RRULE value to icalendar's canonical form, e.g. FREQ first.
+    Cached, since calendars tend to repeat the same rules.
+    Args:
+        rrule (str): The RRULE value as found in the ICS file.
+    Returns:
+        str: The RRULE as icalendar would serialize it.
+    """
+    return vRecur(vRecur.from_ical(rrule)).to_ical().decode()
+
+def _parse_date_or_datetime(params: Dict[str, str], value: str) -> Union[date, datetime]:
+    """
+    Parses a DTSTART/DTEND value the same way icalendar does for the supported parameters.
+    Args:
+        params (Dict[str, str]): The parameters of the property.
+        value (str): The value of the property.
+    Returns:
+        date or datetime: The parsed date, naive datetime or timezone-aware datetime.
+    Raises:
+        ValueError: If the value or its parameters are not supported.
+    """
+    if params.keys() - {'VALUE', 'TZID'}:
+        raise ValueError(f"Unsupported parameters: {params}")
+
+    if len(value) == 8 and params.get('VALUE', 'DATE') == 'DATE':
+        return date.fromisoformat(value)
+    if params.get('VALUE', 'DATE-TIME') != 'DATE-TIME':
+        raise ValueError(f"Unsupported value type: {params['VALUE']}")
+
+    if len(value) == 16 and value[-1] == 'Z' and 'TZID' not in params:
+        return datetime.fromisoformat(value)
+    if len(value) != 15:
+        raise ValueError(f"Unsupported date-time: {value}")
+
+    timestamp = datetime.fromisoformat(value)
+    if 'TZID' in params:
+        # Localized with pytz like icalendar, so ambiguous local times resolve identically
+        timestamp = pytz.timezone(params['TZID'].strip('/')).localize(timestamp)
+    return timestamp
+
+def _parse_vevents_fast(ics_content: bytes) -> Tuple[CalendarEvent, ...]:
+    """
+    Parses the VEVENTs of an iCalendar (ICS) content with a minimal line-based parser.
+    Only the properties needed for events are read, nested components like VALARM are skipped.
+    Args:
+        ics_content (bytes): The iCalendar content as bytes.
+    Returns:
+        Tuple[CalendarEvent, ...]: The events of the calendar.
+    Raises:
+        ValueError: If the content uses anything the parser does not support.
+        KeyError: If a TZID is not a known timezone.
+    """
+    events = []
+    properties: Dict[str, Tuple[Dict[str, str], str]] = {}
+    depth = 0
+
+    # Like icalendar's Contentline.parts(), \, \: \; and \\ are percent-encoded before splitting
+    # the lines into name, parameters and value, and each part is decoded again afterwards
+    content = escape_string(_FOLD_RE.sub('', ics_content.decode('utf-8')))
+
+    # Split on \r?\n only like icalendar, other line breaks like U+2028 are part of the value
+    for line in NEWLINE.split(content):
+        colon = line.find(':')
+        if colon < 0:
+            continue
+        if '"' in line[:colon]:
+            # Quoted parameter values may contain ':' or ';'
+            raise ValueError(f"Unsupported content line: {line}")
+
+        name, *raw_params = line[:colon].split(';')
+        name = unescape_string(name).upper()
+        value = unescape_string(line[colon + 1:])
+
+        if name == 'BEGIN':
+            if depth or value.upper() == 'VEVENT':
+                depth += 1
+            continue
+        if name == 'END':
+            if depth == 1:
+                if 'DTSTART' not in properties or 'DTEND' not in properties:
+                    raise ValueError("VEVENT without DTSTART or DTEND")
+
+                summary = properties.get('SUMMARY')
+                description = properties.get('DESCRIPTION')
+                rrule = properties.get('RRULE')
+                events.append(CalendarEvent(
+                    dtstart=_parse_date_or_datetime(*properties['DTSTART']),
+                    dtend=_parse_date_or_datetime(*properties['DTEND']),
+                    summary=unescape_char(summary[1]) if summary else None,
+                    description=unescape_char(description[1]) if description else None,
+                    rrule=_canonical_rrule(rrule[1]) if rrule else None
+                ))
+                properties = {}
+            depth = max(depth - 1, 0)
+            continue
+
+        if depth != 1 or name not in _PROPERTIES:
+            continue
+        if name in properties:
+            raise ValueError(f"Duplicate property: {name}")
+
+        params = {}
+        for param in raw_params:
+            key, _, param_value = param.partition('=')
+            params[unescape_string(key).upper()] = unescape_string(param_value)
+        properties[name] = (params, value)
+
+    return tuple(events)
+
+def _parse_vevents_icalendar(ics_content: bytes) -> Tuple[CalendarEvent, ...]:
+    """
+    Parses the VEVENTs of an iCalendar (ICS) content with icalendar.
+    Args:
+        ics_content (bytes): The iCalendar content as bytes.
+    Returns:
+        Tuple[CalendarEvent, ...]: The events of the calendar.
+    """
+    gcal = Calendar.from_ical(ics_content)
+    return tuple(
+        CalendarEvent(
+            dtstart=component.get('dtstart').dt,
+            dtend=component.get('dtend').dt,
+            summary=component.get('summary'),
+            description=component.get('description'),
+            rrule=component.get('RRULE').to_ical().decode() if 'RRULE' in component else None
+        )
+        for component in gcal.walk() if component.name == "VEVENT"
+    )
+
+def parse_vevents(ics_content: bytes) -> Tuple[CalendarEvent, ...]:
+    """
+    Parses the VEVENTs of an iCalendar (ICS) content.
+    A minimal parser handles the common cases, content it does not support
+    (e.g. quoted parameters or custom VTIMEZONE ids) is parsed with icalendar instead.
+    Args:
+        ics_content (bytes): The iCalendar content as bytes.
+    Returns:
+        Tuple[CalendarEvent, ...]: The events of the calendar.
+    """
+    try:
+        return _parse_vevents_fast(ics_content)
+    except (ValueError, KeyError):
+        return _parse_vevents_icalendar(ics_content)
@@ -1,19 +1,66 @@
+import gzip
+import hashlib
+import threading
 from datetime import datetime
+from typing import Optional
 
 import requests
-from flask import Blueprint, Response, jsonify, request
+from cachetools import TTLCache
+from flask import Blueprint, Response, current_app, jsonify, request
 
 from app.event import EventList
-from app.event_fetcher import ICS_URL, fetch_events
+from app.event_fetcher import ICS_URL, fetch_events, get_week_start
 
 app = Blueprint('app', __name__)
 
+# Serialized event responses as (etag, json, gzipped json), keyed by (ICS URL, week start)
+_EVENTS_RESPONSE_CACHE = TTLCache(maxsize=8, ttl=60)
+_EVENTS_RESPONSE_LOCK = threading.Lock()
+
+
+def _events_response(current_time: Optional[datetime]=None) -> Response:
+    """
+    Builds the events response for the week of the given time.
+    The serialized events are cached for a short time, conditional requests
+    are answered with 304 and clients accepting gzip get the compressed body.
+    Args:
+        current_time (Optional[datetime]): The current time. If not provided, the current UTC time will be used.
+    Returns:
+        Response: The JSON response with the events.
+    """
+    week_start = get_week_start(current_time)
+    key = (ICS_URL, week_start.isoformat())
+
+    with _EVENTS_RESPONSE_LOCK:
+        cached = _EVENTS_RESPONSE_CACHE.get(key)
+
+    if cached is None:
+        event_list: EventList = fetch_events(week_start)
+
+        body = current_app.json.dumps({"events": event_list.serialize()}).encode()
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = (etag, body, gzip.compress(body, compresslevel=6))
+
+        with _EVENTS_RESPONSE_LOCK:
+            _EVENTS_RESPONSE_CACHE[key] = cached
+
+    etag, body, gzipped_body = cached
+
+    if request.accept_encodings['gzip'] > 0:
+        response = Response(gzipped_body, mimetype='application/json', headers={'Content-Encoding': 'gzip'})
+    else:
+        response = Response(body, mimetype='application/json')
+
+    # Weak, as the same ETag is used for the plain and the gzipped body
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+
+    return response.make_conditional(request)
+
 @app.route('/api/events', methods=['GET'])
 def get_events():
     try:
-        event_list: EventList = fetch_events()
-
-        return jsonify({"events": event_list.serialize()})
+        return _events_response()
     except Exception as e:
         return jsonify({"events": None, "error": str(e)}), 500
 
@@ -30,9 +77,7 @@ def post_events():
         # Parse the ISO string into a datetime object if current_time is not None
         current_time = datetime.fromisoformat(current_time) if current_time else None
 
-        event_list: EventList = fetch_events(current_time)
-
-        return jsonify({"events": event_list.serialize()})
+        return _events_response(current_time)
     except ValueError:
         return jsonify({"events": None, "error": "Invalid date format. Use ISO format (YYYY-MM-DDTHH:MM:SS)"}), 400
     except Exception as e:
@@ -0,0 +1,72 @@
+import unittest
+
+from app.ics_parser import _parse_vevents_fast, _parse_vevents_icalendar
+
+ICS = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'BEGIN:VTIMEZONE\r\n'
+    'TZID:Europe/Berlin\r\n'
+    'BEGIN:STANDARD\r\n'
+    'DTSTART:19701025T030000\r\n'
+    'TZOFFSETFROM:+0200\r\n'
+    'TZOFFSETTO:+0100\r\n'
+    'END:STANDARD\r\n'
+    'END:VTIMEZONE\r\n'
+    'BEGIN:VEVENT\r\n'
+    'DTSTART;TZID=Europe/Berlin:20241027T023000\r\n'
+    'DTEND;TZID=Europe/Berlin:20241027T033000\r\n'
+    'SUMMARY;LANGUAGE=de:Hallo\\, Welt\\; foo\\\\bar\r\n'
+    'DESCRIPTION:Line one\\nLine two with a long text that is folded over\r\n'
+    '  multiple lines<br>ok\r\n'
+    'RRULE:INTERVAL=2;FREQ=WEEKLY;BYDAY=SU,MO;UNTIL=20301231\r\n'
+    'BEGIN:VALARM\r\n'
+    'DESCRIPTION:alarm\r\n'
+    'TRIGGER:-PT10M\r\n'
+    'END:VALARM\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'DTSTART;VALUE=DATE:20241020\r\n'
+    'DTEND;VALUE=DATE:20241021\r\n'
+    'SUMMARY:All day\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'DTSTART:20241021T080000Z\r\n'
+    'DTEND:20241021T090000Z\r\n'
+    'SUMMARY:50%3A50 at 10\\:30\r\n'
+    'DESCRIPTION:Join https://www.google.com/url?q=https%3A%2F%2Fmeet.google.com%2Fabc\\, x\\\\n\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'DTSTART:20241021T100000Z\r\n'
+    'DTEND:20241021T110000Z\r\n'
+    'SUMMARY:Separators\r\n'
+    'DESCRIPTION:line one\u2028line two: rest\rcr\x0bvt\x0cff\x1cfs\x1dgs\x1ers\x85nel\u2029ps\u2028DTSTART:20200101T000000Z\r\n'
+    'END:VEVENT\r\n'
+    'END:VCALENDAR\r\n'
+).encode()
+
+
+class ParseVEventsTest(unittest.TestCase):
+
+    def test_fast_parser_matches_icalendar(self):
+        fast = _parse_vevents_fast(ICS)
+        expected = _parse_vevents_icalendar(ICS)
+
+        self.assertEqual(len(fast), 4)
+        self.assertEqual(fast, expected)
+
+    def test_escapes_are_decoded_like_icalendar(self):
+        event = _parse_vevents_fast(ICS)[2]
+
+        self.assertEqual(event.summary, '50:50 at 10:30')
+        self.assertEqual(event.description, 'Join https://www.google.com/url?q=https:%2F%2Fmeet.google.com%2Fabc, x\n')
+
+    def test_line_separators_are_kept_in_values(self):
+        description = _parse_vevents_fast(ICS)[3].description
+
+        self.assertTrue(description.startswith('line one\u2028line two: rest\rcr'))
+        self.assertTrue(description.endswith('\u2028DTSTART:20200101T000000Z'))
+
+
+if __name__ == '__main__':
+    unittest.main()